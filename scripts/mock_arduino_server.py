@@ -52,6 +52,7 @@ from pathlib import Path
 from typing import List, Optional
 
 STOP_EVENT = threading.Event()
+MAX_LAG_S = 0.1  # Maximaler Rückstand, der ohne Pause aufgeholt wird
 RUN_MARKER_PATH: str | None = None  # Pfad zur Marker-Datei
 
 
@@ -261,6 +262,32 @@ def apply_noise(row: DataRow, noise_amp: float) -> DataRow:
     )
 
 
+def pace(deadline: float, delay: float) -> float:
+    """Schlafe bis zum nächsten Sendezeitpunkt eines festen Zeitplans.
+
+    Ein ``time.sleep(delay)`` nach jedem Paket addiert Sende- und
+    Schleifen-Overhead (und das Überschwingen von sleep) auf jedes Intervall,
+    sodass hohe Raten deutlich unterschritten werden. Hier rückt der Zeitplan
+    um ``delay`` vor; liegt der Sender zurück, wird ohne Pause gesendet, bis
+    der Rückstand (höchstens ``MAX_LAG_S``) aufgeholt ist.
+
+    Args:
+        deadline: Bisheriger Sendezeitpunkt (``time.monotonic()``-Basis)
+        delay: Abstand zum nächsten Paket in Sekunden
+
+    Returns:
+        float: Der neue Sendezeitpunkt
+    """
+    deadline += delay
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    elif remaining < -MAX_LAG_S:
+        # Nach einem Hänger neu aufsetzen statt einen Burst zu senden
+        deadline = time.monotonic()
+    return deadline
+
+
 def udp_sender_thread(
     sock: socket.socket,
     target_addr: tuple,
@@ -278,6 +305,7 @@ def udp_sender_thread(
     idx = 0
     n = len(rows)
     packet_count = 0
+    deadline = time.monotonic()
 
     while not STOP_EVENT.is_set():
         row = rows[idx]
@@ -320,8 +348,7 @@ def udp_sender_thread(
         if jitter_ms > 0:
             delta = random.uniform(-jitter_ms / 1000.0, jitter_ms / 1000.0)
             delay = max(0.0, delay + delta)
-        if delay > 0:
-            time.sleep(delay)
+        deadline = pace(deadline, delay)
 
         idx = next_idx
         if end_of_cycle:
@@ -375,6 +402,7 @@ def client_thread(
 
         idx = 0
         n = len(rows)
+        deadline = time.monotonic()
         while not STOP_EVENT.is_set():
             row = rows[idx]
             noisy = apply_noise(row, noise_amp)
@@ -414,8 +442,7 @@ def client_thread(
             if jitter_ms > 0:
                 delta = random.uniform(-jitter_ms / 1000.0, jitter_ms / 1000.0)
                 delay = max(0.0, delay + delta)
-            if delay > 0:
-                time.sleep(delay)
+            deadline = pace(deadline, delay)
 
             idx = next_idx
             if end_of_cycle:
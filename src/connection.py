@@ -19,12 +19,12 @@ from PySide6.QtCore import Slot, QTimer  # pylint: disable=no-name-in-module
 try:
     from .pyqt.ui_connection import Ui_Dialog as Ui_Connection
     from .debug_utils import Debug
-    from .device_manager import DeviceManager
+    from .device_manager import DeviceManager, parse_host_port
     from .helper_classes import import_config
 except ImportError:
     from .pyqt.ui_connection import Ui_Dialog as Ui_Connection
     from debug_utils import Debug
-    from device_manager import DeviceManager
+    from device_manager import DeviceManager, parse_host_port
     from helper_classes import import_config
 
 CONFIG = import_config()["connection"]
@@ -116,30 +116,9 @@ class ConnectionWindow(QDialog):
         """Parse host:port from a string.
 
         Supports forms like 'host:port', 'http://host:port', '[ipv6]:port'.
+        Uses the same parser as :class:`DeviceManager`.
         """
-        ip = ip.strip()
-        # Remove scheme
-        if "://" in ip:
-            ip = ip.split("://", 1)[1]
-        # IPv6 wrapped in []
-        if ip.startswith("["):
-            host, rest = ip.split("]", 1)
-            host = host[1:]
-            if rest.startswith(":"):
-                port = int(rest[1:])
-            else:
-                port = 80
-            return host, port
-        # Regular host:port
-        if ip.count(":") == 1:
-            host, port_s = ip.split(":", 1)
-            try:
-                port = int(port_s)
-            except ValueError:
-                port = 80
-            return host, port
-        # Host only
-        return ip, 80
+        return parse_host_port(ip)
 
     def _set_ssid_text(self, ssid: str):
         """
@@ -3,13 +3,17 @@
 
 """Data controller for managing measurements and plot updates."""
 
-from typing import Optional, List, Tuple, Dict, Union
+from typing import Deque, Optional, List, Tuple, Dict, Union
 import math
 import queue
 import threading
+from collections import deque
+from itertools import repeat
 from time import time
 from datetime import datetime
 
+import numpy as np
+
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
     QLCDNumber,
     QTableView,
@@ -68,9 +72,10 @@ class DataController:
         # ---------------- Internal Storage ----------------
         # Export buffer (only when recording True)
         self.data_points: List[Tuple[float, float, float]] = []
-        # Live plot series (rolling window, always filled)
-        self.freq_series: List[Tuple[float, float, str]] = []
-        self.gyro_series: List[Tuple[float, float, str]] = []
+        # Live plot series (rolling window, always filled); the deques drop
+        # the oldest entries themselves instead of re-slicing per point
+        self.freq_series: Deque[Tuple[float, float, str]] = deque(maxlen=max_history)
+        self.gyro_series: Deque[Tuple[float, float, str]] = deque(maxlen=max_history)
 
         # Recording flag
         self.recording: bool = False
@@ -141,16 +146,12 @@ class DataController:
 
         if not math.isnan(freq_for_plot):
             self.freq_series.append((elapsed_s, freq_for_plot, ts))
-            if len(self.freq_series) > self.max_history:
-                self.freq_series = self.freq_series[-self.max_history :]
             if used_fallback:
                 Debug.debug("Frequency fallback -> accel_z für Plot verwendet")
 
         # Gyro Z series
         if not math.isnan(gyro_z):
             self.gyro_series.append((elapsed_s, gyro_z, ts))
-            if len(self.gyro_series) > self.max_history:
-                self.gyro_series = self.gyro_series[-self.max_history :]
         else:
             if math.isnan(freq_for_plot):
                 Debug.debug("Alle Kanäle NaN – nichts zu plotten in diesem Schritt")
@@ -164,6 +165,54 @@ class DataController:
         except Exception as e:  # pragma: no cover
             Debug.error(f"Plot update failed: {e}")
 
+    def handle_multi_batch(self, batch: np.ndarray) -> None:
+        """Handle a batch of multi channel data updates.
+
+        Same as calling handle_multi_data_point for each row, but extends the
+        series once per batch and updates the plots once. All
+        points of the batch share one timestamp.
+
+        Args:
+            batch: Array of shape (n, 4) with the columns
+                (elapsed_s, frequency, accel_z, gyro_z)
+        """
+        if not len(batch):
+            return
+        ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        elapsed_s, frequency, accel_z, gyro_z = batch.T
+        if self.recording:
+            self.data_points.extend(
+                zip(elapsed_s.tolist(), frequency.tolist(), gyro_z.tolist())
+            )
+
+        # Same fallback as for single points: accel_z replaces a NaN frequency
+        freq_for_plot = np.where(
+            np.isnan(frequency) & ~np.isnan(accel_z), accel_z, frequency
+        )
+        valid = ~np.isnan(freq_for_plot)
+        if valid.any():
+            self.freq_series.extend(
+                zip(
+                    elapsed_s[valid].tolist(),
+                    freq_for_plot[valid].tolist(),
+                    repeat(ts),
+                )
+            )
+
+        valid = ~np.isnan(gyro_z)
+        if valid.any():
+            self.gyro_series.extend(
+                zip(elapsed_s[valid].tolist(), gyro_z[valid].tolist(), repeat(ts))
+            )
+
+        try:
+            if self.f_plot and self.freq_series:
+                self.f_plot.update_plot(self.freq_series)
+            if self.g_plot and self.gyro_series:
+                self.g_plot.update_plot(self.gyro_series)
+        except Exception as e:  # pragma: no cover
+            Debug.error(f"Plot update failed: {e}")
+
     # Legacy single-value interfaces (no-op or thin wrappers) -----------------
     def add_data_point_fast(self, *_args, **_kwargs) -> None:  # pragma: no cover
         Debug.debug("add_data_point_fast legacy call ignored (multi-mode active)")
@@ -223,8 +272,8 @@ class DataController:
         try:
             # Remove stored points (both full and GUI data)
             self.data_points = []
-            self.freq_series = []
-            self.gyro_series = []
+            self.freq_series.clear()
+            self.gyro_series.clear()
 
             # Clear the queue
             with self._queue_lock:
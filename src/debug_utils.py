@@ -16,6 +16,11 @@ class Debug:
     This class provides central debug and logging functions,
     to systematically log errors and program flow.
 
+    The log calls themselves are implemented as module-level functions
+    (``debug``, ``info``, ``error``, ``critical``, ``debug_enabled``) and
+    exposed here as static aliases, so hot code paths can import them
+    directly and skip the class attribute lookup.
+
     Attribute:
         logger: The logger used for debug output
         DEBUG_LEVEL: Current debug level (0-3)
@@ -78,11 +83,14 @@ class Debug:
             log_dir: Directory where logs should be stored
             app_name: Application name used for the log file
         """
+        global _LEVEL, _LOGGER
         cls.DEBUG_LEVEL = debug_level
+        _LEVEL = debug_level
 
         # Create logger
         cls.logger = logging.getLogger(app_name)
         cls.logger.setLevel(logging.DEBUG)
+        _LOGGER = cls.logger
 
         # Handler for console output
         console_handler = logging.StreamHandler()
@@ -132,88 +140,6 @@ class Debug:
 
         cls.info(f"Log file created: {cls.LOG_FILE}")
 
-    @classmethod
-    def error(cls, message, exc_info=None):
-        """
-        Log an error message.
-
-        Args:
-            message: Error message to log
-            exc_info: Exception info (optional)
-        """
-        # Klassennamen und Funktionsnamen ermitteln
-        if cls.DEBUG_LEVEL >= cls.DEBUG_VERBOSE:
-            prefix = cls._get_caller_info()
-            message = f"{prefix} {message}"
-
-        if not cls.logger:
-            print(f"FEHLER: {message}")
-            return
-
-        if exc_info:
-            cls.logger.error(message, exc_info=True)
-        else:
-            cls.logger.error(message)
-
-    @classmethod
-    def info(cls, message):
-        """
-        Log an informational message.
-
-        Args:
-            message: Information to log
-        """
-        # Klassennamen und Funktionsnamen ermitteln
-        if cls.DEBUG_LEVEL >= cls.DEBUG_VERBOSE:
-            prefix = cls._get_caller_info()
-            message = f"{prefix} {message}"
-
-        if not cls.logger:
-            if cls.DEBUG_LEVEL >= cls.DEBUG_INFO:
-                print(f"INFO: {message}")
-            return
-
-        cls.logger.info(message)
-
-    @classmethod
-    def debug(cls, message):
-        """
-        Log detailed debug information.
-
-        Args:
-            message: Debug information to log
-        """
-        # Klassennamen und Funktionsnamen ermitteln
-        if cls.DEBUG_LEVEL >= cls.DEBUG_VERBOSE:
-            prefix = cls._get_caller_info()
-            message = f"{prefix} {message}"
-
-        if not cls.logger:
-            if cls.DEBUG_LEVEL >= cls.DEBUG_VERBOSE:
-                print(f"DEBUG: {message}")
-            return
-
-        cls.logger.debug(message)
-
-    @classmethod
-    def critical(cls, message):
-        """
-        Log a critical error message.
-
-        Args:
-            message: Critical error message to log
-        """
-        # Klassennamen und Funktionsnamen ermitteln
-        if cls.DEBUG_LEVEL >= cls.DEBUG_VERBOSE:
-            prefix = cls._get_caller_info()
-            message = f"{prefix} {message}"
-
-        if not cls.logger:
-            print(f"KRITISCH: {message}")
-            return
-
-        cls.logger.critical(message)
-
     @classmethod
     def exception_hook(cls, exc_type, exc_value, exc_traceback):
         """
@@ -267,3 +193,112 @@ class Debug:
                 return f"[{function_name}]"
 
         return ""  # Fallback if caller information cannot be determined
+
+
+# Module-level mirrors of Debug.logger / Debug.DEBUG_LEVEL, kept in sync by
+# Debug.init so the log functions below only touch module globals.
+_LOGGER = None
+_LEVEL = Debug.DEBUG_OFF
+_VERBOSE = Debug.DEBUG_VERBOSE
+_INFO = Debug.DEBUG_INFO
+
+
+def error(message, exc_info=None):
+    """
+    Log an error message.
+
+    Args:
+        message: Error message to log
+        exc_info: Exception info (optional)
+    """
+    # Klassennamen und Funktionsnamen ermitteln
+    if _LEVEL >= _VERBOSE:
+        message = f"{Debug._get_caller_info()} {message}"
+
+    if _LOGGER is None:
+        print(f"FEHLER: {message}")
+        return
+
+    if exc_info:
+        _LOGGER.error(message, exc_info=True)
+    else:
+        _LOGGER.error(message)
+
+
+def info(message):
+    """
+    Log an informational message.
+
+    Args:
+        message: Information to log
+    """
+    # Klassennamen und Funktionsnamen ermitteln
+    if _LEVEL >= _VERBOSE:
+        message = f"{Debug._get_caller_info()} {message}"
+
+    if _LOGGER is None:
+        if _LEVEL >= _INFO:
+            print(f"INFO: {message}")
+        return
+
+    _LOGGER.info(message)
+
+
+def debug(message):
+    """
+    Log detailed debug information.
+
+    Args:
+        message: Debug information to log
+    """
+    # Klassennamen und Funktionsnamen ermitteln
+    if _LEVEL >= _VERBOSE:
+        message = f"{Debug._get_caller_info()} {message}"
+
+    if _LOGGER is None:
+        if _LEVEL >= _VERBOSE:
+            print(f"DEBUG: {message}")
+        return
+
+    _LOGGER.debug(message)
+
+
+def debug_enabled():
+    """
+    Check whether debug messages are currently emitted anywhere.
+
+    Hot code paths use this to skip building debug messages that would be
+    discarded anyway.
+
+    Returns:
+        bool: True if a call to debug() produces output
+    """
+    if _LOGGER is None:
+        return _LEVEL >= _VERBOSE
+    return _LOGGER.isEnabledFor(logging.DEBUG)
+
+
+def critical(message):
+    """
+    Log a critical error message.
+
+    Args:
+        message: Critical error message to log
+    """
+    # Klassennamen und Funktionsnamen ermitteln
+    if _LEVEL >= _VERBOSE:
+        message = f"{Debug._get_caller_info()} {message}"
+
+    if _LOGGER is None:
+        print(f"KRITISCH: {message}")
+        return
+
+    _LOGGER.critical(message)
+
+
+# Keep the established ``Debug.<level>(...)`` API working for all callers
+Debug.error = staticmethod(error)
+Debug.info = staticmethod(info)
+Debug.debug = staticmethod(debug)
+Debug.debug_enabled = staticmethod(debug_enabled)
+Debug.critical = staticmethod(critical)
@@ -1,11 +1,16 @@
 """Device management for line-based (CSV) streaming data acquisition via UDP."""
 
 from typing import Callable, Optional, Tuple, List
+import queue
+import re
+import selectors
 import time
 from threading import Event
 import socket
-from math import nan
+from math import isfinite, isnan, nan
+from urllib.parse import urlsplit
 
+import numpy as np
 from PySide6.QtCore import (
     QThread,
     Signal,
@@ -15,9 +20,50 @@ from PySide6.QtCore import (
 
 # Relative imports für installiertes Package, absolute für lokale Ausführung
 try:
-    from .debug_utils import Debug
+    from .debug_utils import debug, debug_enabled, info, error
 except ImportError:
-    from debug_utils import Debug
+    from debug_utils import debug, debug_enabled, info, error
+
+# Corruption heuristics for raw CSV lines, evaluated as single C-level scans
+_REPEAT_RE = re.compile(rb"(.)\1{5}")  # 6 identical bytes in a row
+# Token syntax accepted by float() for ASCII input (incl. nan/inf and digit
+# separators), so numeric checks need no exception handling
+_FLOAT_RE = re.compile(
+    r"\s*[+-]?(?:(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)"
+    r"(?:[eE][+-]?\d(?:_?\d)*)?|inf(?:inity)?|nan)\s*",
+    re.ASCII | re.IGNORECASE,
+)
+
+# HTTP meta keywords that disqualify a line as CSV header
+_META_RE = re.compile(
+    r"content-type|cache-control|pragma|expires|transfer-encoding"
+    r"|connection:|server:|http/1\.1"
+)
+
+
+def _has_repeated_run(data: bytes) -> bool:
+    """Vectorised form of ``_REPEAT_RE.search`` for a whole buffer."""
+    a = np.frombuffer(data, dtype=np.uint8)
+    same = a[1:] == a[:-1]
+    return bool((same[:-4] & same[1:-3] & same[2:-2] & same[3:-1] & same[4:]).any())
+
+
+class _HeaderLayout:
+    """Column layout of one detected header.
+
+    Resolved once per header so the per-line path reads fixed slots instead
+    of looking up column names. Indices are -1 for fields not present.
+    """
+
+    __slots__ = ("n_fields", "time", "freq", "accel_z", "gyro_z")
+
+    def __init__(self, header: List[str]) -> None:
+        header_map = {n.lower(): i for i, n in enumerate(header)}
+        self.n_fields = len(header)
+        self.time = header_map.get("current time", -1)
+        self.freq = header_map.get("frequency", -1)
+        self.accel_z = header_map.get("acceleration z", -1)
+        self.gyro_z = header_map.get("gyro z", -1)
 
 
 class DataAcquisitionThread(QThread):
@@ -27,14 +73,41 @@ class DataAcquisitionThread(QThread):
     (elapsed_time_sec, frequency, accel_z, gyro_z). The elapsed time is
     derived from the 'Current Time' column of the incoming stream.
     Frequency is now directly provided in the data stream.
+
+    The multi-value samples are additionally collected and emitted as
+    ``multi_data_batch``, an ``(n, 4)`` array with the same columns, at most
+    every ``BATCH_SIZE`` samples or ``BATCH_INTERVAL`` seconds. The array is
+    column-major (Fortran order), so ``batch[:, i]`` is a contiguous channel.
+
+    ``data_point`` and ``multi_data_point`` are only emitted while
+    ``emit_points`` is True. A thread started through ``DeviceManager`` has
+    it switched off, because the manager serves its callbacks from
+    ``multi_data_batch``; other subscribers of such a thread should connect
+    to ``multi_data_batch`` or set ``emit_points`` back to True.
     """
 
-    # First argument now: elapsed time in seconds (float) based on 'Current Time'
+    # First argument: elapsed time in seconds based on 'Current Time'.
+    # data_point/multi_data_point only fire while emit_points is True.
     data_point = Signal(float, float)
     multi_data_point = Signal(float, float, float, float)
+    multi_data_batch = Signal(object)  # np.ndarray (n, 4), see class docstring
     connection_lost = Signal()  # New signal for connection loss detection
 
     DEFAULT_PRIMARY_FIELD = "accel_magnitude"
+    # Minimum number of complete lines in one buffer pass before the
+    # vectorised numpy parser pays off over the per-line path
+    BULK_MIN_LINES = 4
+    # Samples per multi_data_batch emission and max. age of a pending batch (s)
+    BATCH_SIZE = 64
+    BATCH_INTERVAL = 0.02
+    # Maximum number of queued datagrams drained from the socket per wake-up
+    RX_BATCH_MAX = 32
+    # Size of the reusable datagram receive buffer (max. UDP payload)
+    RX_DATAGRAM_SIZE = 65536
+    # Received chunks waiting for the parser before the oldest are dropped
+    RX_QUEUE_MAX = 1024
+    # Longest idle wait for new data (s); stop() wakes both threads early
+    IDLE_WAIT = 0.5
     DEFAULT_HEADER_BASIC = [
         "Current Time",
         "Frequency",
@@ -45,6 +118,8 @@ class DataAcquisitionThread(QThread):
         "Gyro Y",
         "Gyro Z",
     ]
+    # Lowercase header names for O(1) membership tests during header detection
+    _HEADER_NAMES = frozenset(n.lower() for n in DEFAULT_HEADER_BASIC)
 
     def __init__(self, manager: "DeviceManager") -> None:  # noqa: F821
         super().__init__()
@@ -52,16 +127,36 @@ class DataAcquisitionThread(QThread):
         self._running = False
 
         self._index = 0  # retained for potential legacy internal use
-        self._buffer = ""
+        self._buffer = bytearray()  # raw bytes, decoded per complete line
+        # Reusable receive buffer, filled via recv_into() without reallocation
+        self._rx_buf = bytearray(self.RX_DATAGRAM_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        # Received payload handed over from the receiver thread
+        self._rx_queue: "queue.SimpleQueue[bytes]" = queue.SimpleQueue()
         self._header = []
         self._header_detected = False
-        self._last_log = time.time()
-        self._time_base_raw = None  # raw base of 'Current Time'
+        self._layout = _HeaderLayout(self._header)
+        self._last_log = time.monotonic()
+        # Raw base of 'Current Time'; the device sends unsigned ms counters,
+        # so a negative value marks "no base yet"
+        self._time_base_raw = -1.0
         self._last_elapsed_sec = 0.0
         self._skip_first_point = False  # Flag to discard first point after reset
+        # Set by reset_index() from the GUI thread, applied by run() so the
+        # time base and batch are only ever mutated by this thread
+        self._reset_requested = False
+        self._time_debug_count = 0  # number of logged time conversions
+        # Pending samples for multi_data_batch, flushed by size or age.
+        # Column-major, so each channel is one contiguous array (SoA)
+        self._batch = np.empty((self.BATCH_SIZE, 4), dtype=np.float64, order="F")
+        self._batch_n = 0
+        self._batch_started = 0.0
+        # Also emit data_point/multi_data_point for every sample; switched
+        # off by the DeviceManager, which serves its callbacks from batches
+        self.emit_points = True
 
         # Connection monitoring
-        self._last_data_time = time.time()
+        self._last_data_time = time.monotonic()
         self._data_timeout = 5.0  # 5 seconds without data = connection lost
         self._connection_lost_emitted = False
 
@@ -78,189 +173,341 @@ class DataAcquisitionThread(QThread):
         if not raw_line:
             return False
 
-        meta_keywords = [
-            "content-type",
-            "cache-control",
-            "pragma",
-            "expires",
-            "transfer-encoding",
-            "connection:",
-            "server:",
-            "http/1.1",
-        ]
         # Check for http meta keywords
-        if any(k in raw_line for k in meta_keywords):
+        if _META_RE.search(raw_line):
             return False
 
-        parts = [f.strip() for f in raw_line.split(",") if f.strip()]
+        parts = [f for f in map(str.strip, raw_line.split(",")) if f]
         if len(parts) < 3:  # Not enough parts
             return False
-        if all(self._is_number(p) for p in parts):  # All parts are numbers
-            return False
-        if any(":" in p for p in parts):  # Check for key-value pairs
+        # One pass: reject key-value pairs, count valid header names and
+        # track whether all parts are numbers
+        matches = 0
+        all_numeric = True
+        header_names = self._HEADER_NAMES
+        for p in parts:
+            if ":" in p:  # Check for key-value pairs
+                return False
+            if p in header_names:
+                matches += 1
+                all_numeric = False
+            elif all_numeric and not _FLOAT_RE.fullmatch(p):
+                all_numeric = False
+        if all_numeric:  # All parts are numbers
             return False
-        # Check for valid header parts
-        expected = [x.lower() for x in self.DEFAULT_HEADER_BASIC.copy()]
-        matches = sum(1 for p in parts if p in expected)  # Count matches
         if matches == 0 or matches < len(parts) / 3:
             return False
         self._header = parts  # Store the detected header
         self._header_detected = True
-        Debug.info(f"Header detected: {self._header}")
+        self._layout = _HeaderLayout(parts)
+        info(f"Header detected: {self._header}")
         return True
 
-    @staticmethod
-    def _is_number(token: str) -> bool:
-        """Check if a string can be converted to a float."""
-        try:
-            float(token)
-            return True
-        except ValueError:
-            return False
-
     # ---------------- Main loop -----------------
     def run(self) -> None:  # noqa: D401
         self._running = True
-        Debug.info("CSV acquisition thread started (UDP mode)")
-        sock = self.manager.connection
-        if not sock:
-            Debug.error("No active socket – thread exits.")
+        info("CSV acquisition thread started (UDP mode)")
+        if not self.manager.connection:
+            error("No active socket – thread exits.")
             return
-        sock.settimeout(0.1)
-        while self._running and not self.isInterruptionRequested():
-            if not self.manager.connected:
-                time.sleep(0.05)
-                continue
-            # Check if connection changed (after reconnect)
-            if sock != self.manager.connection:
-                Debug.debug("Socket changed - updating reference")
-                sock = self.manager.connection
-                if not sock:
-                    time.sleep(0.05)
-                    continue
-                sock.settimeout(0.1)
+        # Socket reads run on their own thread, this one parses and emits
+        receiver = _DatagramReceiver(self)
+        # Same priority as this thread; the receiver sleeps in select() and
+        # only wakes briefly to drain the socket into the shared chunk queue
+        receiver.start(QThread.HighPriority)
+        # Hot-loop lookups bound once; the buffer is only ever mutated in place
+        buffer = self._buffer
+        get = self._rx_queue.get
+        get_nowait = self._rx_queue.get_nowait
+        empty = queue.Empty
+        monotonic = time.monotonic
+        batch_interval = self.BATCH_INTERVAL
+        idle_wait = self.IDLE_WAIT
+        flush_batch = self._flush_batch
+        interrupted = self.isInterruptionRequested
+        process_buffer = self._process_buffer
+        check_timeout = self._check_connection_timeout
+        periodic_log = self._periodic_log
+        bulk_min_lines = self.BULK_MIN_LINES
+        parsed_at = 0.0
+        complete = 0  # complete lines in buffer, counted per received chunk
+        while self._running and not interrupted():
             try:
-                if sock:  # Ensure sock is not None before using it
-                    chunk = self._receive_chunk(sock)
-                    if chunk:
-                        self._buffer += chunk.decode("utf-8", errors="ignore")
-                        # Reset connection monitoring when data is received
-                        self._last_data_time = time.time()
-                        self._connection_lost_emitted = False
+                try:
+                    # Wake up in time to flush a pending batch or parse
+                    # lines held back for the block parser
+                    pending = self._batch_n or buffer
+                    chunk = get(timeout=batch_interval if pending else idle_wait)
+                except empty:
+                    current = monotonic()
                 else:
-                    time.sleep(0.05)
-                    continue
-                self._process_buffer()
-                self._check_connection_timeout()
-                self._periodic_log()
+                    current = monotonic()
+                    buffer += chunk
+                    complete += chunk.count(b"\n")
+                    # Take everything else queued while we were busy
+                    while True:
+                        try:
+                            chunk = get_nowait()
+                        except empty:
+                            break
+                        buffer += chunk
+                        complete += chunk.count(b"\n")
+                    # Reset connection monitoring when data is received
+                    self._last_data_time = current
+                    self._connection_lost_emitted = False
+                if self._reset_requested:
+                    self._apply_reset()
+                # Complete lines are held back until there are enough for one
+                # numpy block parse, but never longer than a batch interval
+                if buffer:
+                    if (
+                        complete >= bulk_min_lines
+                        or (complete and current - parsed_at >= batch_interval)
+                        or len(buffer) > 1000
+                    ):
+                        process_buffer()
+                        parsed_at = current
+                        complete = 0  # only an incomplete tail is left
+                if self._batch_n and current - self._batch_started >= batch_interval:
+                    flush_batch()
+                # One clock read per wake-up, shared by all checks below
+                check_timeout(current)
+                periodic_log(current)
             except Exception as exc:  # pragma: no cover
-                Debug.error(f"CSV acquisition error: {exc}")
+                error(f"CSV acquisition error: {exc}")
                 time.sleep(0.01)
-        Debug.info("CSV acquisition thread stopped")
+        receiver.stop()
+        self._flush_batch()
+        info("CSV acquisition thread stopped")
 
-    def _receive_chunk(self, sock: socket.socket) -> bytes:
-        try:
-            # Check if socket is still valid
-            if not sock or sock.fileno() == -1:
-                return b""
+    def _receive_chunk(self, sock: socket.socket) -> bytearray:
+        """Drain pending datagrams from the non-blocking socket.
 
-            # For UDP, receive data with address info
-            data, addr = sock.recvfrom(4096)
+        Reads the datagrams already queued in the kernel (at most
+        ``RX_BATCH_MAX``), all into the same preallocated receive buffer.
+        Called from the receiver thread only, after the selector reported
+        the socket as readable.
 
-            # Validate received data
-            if not data:
-                return b""
-
-            # Check for obvious corruption in UDP packet
-            try:
-                # Try to decode as UTF-8 to catch binary corruption early
-                decoded = data.decode("utf-8", errors="strict")
+        Args:
+            sock (socket.socket): The bound UDP socket.
 
-                # Basic sanity check: should contain some CSV-like structure
-                if "," not in decoded and len(decoded) > 10:
-                    Debug.debug(
-                        f"UDP packet doesn't look like CSV data: {decoded[:30]}..."
-                    )
-                    return b""
+        Returns:
+            bytearray: The payload of all valid datagrams read.
+        """
+        received = bytearray()
+        try:
+            # Check if socket is still valid
+            if not sock or sock.fileno() == -1:
+                return received
 
-                return data
-            except UnicodeDecodeError:
-                Debug.debug("UDP packet contains invalid UTF-8, skipping")
-                return b""
+            view = self._rx_view
+            recv_into = sock.recv_into
+            is_valid = self._is_datagram_valid
+            for _ in range(self.RX_BATCH_MAX):
+                try:
+                    n = recv_into(view)
+                except BlockingIOError:
+                    break  # Kernel queue drained
+                if n:
+                    # One slice per datagram, shared by check and copy
+                    payload = view[:n]
+                    if is_valid(payload):
+                        received += payload
+            return received
 
-        except socket.timeout:
-            return b""
         except (OSError, socket.error) as e:  # Handle socket errors more specifically
             if hasattr(e, "errno") and e.errno in (
                 9,
                 104,
                 110,
             ):  # Bad file descriptor, Connection reset, Connection timed out
-                Debug.debug(f"Socket disconnected: {e}")
-                return b""
-            Debug.error(f"Socket error: {e}")
+                debug(f"Socket disconnected: {e}")
+                return received
+            error(f"Socket error: {e}")
             time.sleep(0.05)
-            return b""
+            return received
 
-    def _check_connection_timeout(self) -> None:
-        """Check if no data has been received for too long and emit connection lost signal."""
-        current_time = time.time()
+    @staticmethod
+    def _is_datagram_valid(data: memoryview) -> bool:
+        """Check a received UDP datagram for obvious corruption."""
+        try:
+            # Try to decode as UTF-8 to catch binary corruption early
+            decoded = str(data, "utf-8")
+        except UnicodeDecodeError:
+            debug("UDP packet contains invalid UTF-8, skipping")
+            return False
+
+        # Basic sanity check: should contain some CSV-like structure
+        if "," not in decoded and len(decoded) > 10:
+            debug(f"UDP packet doesn't look like CSV data: {decoded[:30]}...")
+            return False
+        return True
+
+    def _check_connection_timeout(self, current_time: float) -> None:
+        """Check if no data has been received for too long and emit connection lost signal.
+
+        Args:
+            current_time (float): ``time.monotonic()`` of the current wake-up.
+        """
         if (
             current_time - self._last_data_time > self._data_timeout
             and not self._connection_lost_emitted
             and self.manager.connected
         ):
-            Debug.error(f"No data received for {self._data_timeout}s - connection lost")
+            error(f"No data received for {self._data_timeout}s - connection lost")
             self._connection_lost_emitted = True
             self.connection_lost.emit()
 
     def _process_buffer(self) -> None:
-        # Check if buffer contains at least one complete line
-        if "\n" not in self._buffer:
+        # Single split pass; the last element is the incomplete tail
+        # (empty if the buffer ended with a newline)
+        data = bytes(self._buffer)
+        lines = data.split(b"\n")
+        if len(lines) == 1:
             # If buffer is getting too large without newline, it might be corrupted
             if len(self._buffer) > 1000:
-                Debug.debug("Buffer too large without newline, clearing")
-                self._buffer = ""
+                debug("Buffer too large without newline, clearing")
+                del self._buffer[:]
             return
 
-        lines = self._buffer.splitlines(keepends=False)  # Split lines
-        if not self._buffer.endswith("\n") and lines:
-            # Keep the last incomplete line in buffer
-            self._buffer = lines[-1]
-            lines = lines[:-1]
-        else:
-            self._buffer = ""
+        # Only the incomplete tail stays in the buffer
+        tail = lines.pop()
+        del self._buffer[: len(self._buffer) - len(tail)]
+
+        # Process a larger block of data lines in one vectorised pass
+        if self._header_detected and len(lines) >= self.BULK_MIN_LINES:
+            if self._process_bulk(lines, data):
+                return
 
         # Process each complete line
         valid_lines = 0
+        is_line_corrupted = self._is_line_corrupted
+        process_line = self._process_line
         for raw in lines:
-            line = raw.strip()
-            if line:
+            raw = raw.strip()
+            if raw:
                 # Additional check: skip obviously corrupted lines
-                Debug.debug(f"Processing line: {line}...")
-                if self._is_line_corrupted(line):
-                    Debug.debug(f"Corrupted line skipped: {line[:30]}...")
+                if is_line_corrupted(raw):
+                    if debug_enabled():
+                        debug(f"Corrupted line skipped: {raw[:30]!r}...")
                     continue
 
-                self._process_line(line)
+                process_line(raw.decode("ascii"))
                 valid_lines += 1
 
         # Log if we're getting many invalid lines
         if len(lines) > 0 and valid_lines == 0:
-            Debug.debug(f"All {len(lines)} lines were invalid/corrupted")
+            debug(f"All {len(lines)} lines were invalid/corrupted")
 
-    def _is_line_corrupted(self, line: str) -> bool:
-        """Check for obvious signs of line corruption."""
-        # Check for binary data or control characters
+    def _process_bulk(self, lines: List[bytes], data: bytes) -> bool:
+        """Parse a block of data lines with a single numpy call.
+
+        Applies the same filters as the per-line path (corruption, minimum
+        length, field count, value ranges) but converts all fields in one
+        C-level pass instead of splitting and converting every token in
+        Python.
+
+        Args:
+            lines (List[bytes]): Complete lines taken from the buffer.
+            data (bytes): The buffer content the lines were split from.
+
+        Returns:
+            bool: False if the block is not a homogeneous numeric table, in
+            which case the caller falls back to the per-line path.
+        """
+        n_fields = self._layout.n_fields
+        if n_fields < 6:
+            return False
+
+        # Clean blocks go to numpy unchanged: the corruption checks run once
+        # over the whole buffer (conservative, a hit only means the filtered
+        # path below), blank lines and CR/whitespace are handled by loadtxt
+        table = None
+        if (
+            10 <= max(map(len, lines)) <= 500
+            and data.isascii()
+            and not _has_repeated_run(data)
+        ):
+            table = self._load_table(lines)
+        if table is None or table.shape[1] != n_fields:
+            # Rows with the wrong field count are rejected by the per-line path
+            # as well; dropping them here keeps one bad line from failing the
+            # block
+            n_commas = n_fields - 1
+            rows = []
+            for raw in lines:
+                line = raw.strip()
+                if (
+                    len(line) >= 10
+                    and line.count(b",") == n_commas
+                    and not self._is_line_corrupted(line)
+                ):
+                    rows.append(line)
+            if not rows:
+                return False
+            table = self._load_table(rows)
+            if table is None:
+                return False
+
+        # Same range check as _parse_values as one vector predicate over all
+        # rows; NaN compares False and inf exceeds the limit
+        table = table[(np.abs(table[:, 1:]) <= 10000).all(axis=1)]
+        if not len(table):
+            return True
+
+        layout = self._layout
+        elapsed = None
+        if layout.time >= 0:
+            elapsed = self._elapsed_block(table[:, layout.time])
+        if elapsed is None:
+            emit_data = self._emit_data
+            for row in table.tolist():
+                emit_data(row)
+            return True
+
+        if not self.emit_points:
+            # Nothing to emit per sample: copy the columns into the batch
+            # without going through Python per row
+            columns = table.T
+            self._emit_block(
+                elapsed,
+                columns[layout.freq] if layout.freq >= 0 else None,
+                columns[layout.accel_z] if layout.accel_z >= 0 else None,
+                columns[layout.gyro_z] if layout.gyro_z >= 0 else None,
+            )
+            return True
+
+        columns = table.T.tolist()
+        missing = [nan] * len(table)
+        emit_sample = self._emit_sample
+        for sample in zip(
+            elapsed.tolist(),
+            columns[layout.freq] if layout.freq >= 0 else missing,
+            columns[layout.accel_z] if layout.accel_z >= 0 else missing,
+            columns[layout.gyro_z] if layout.gyro_z >= 0 else missing,
+        ):
+            emit_sample(*sample)
+        return True
+
+    @staticmethod
+    def _load_table(rows: List[bytes]) -> Optional[np.ndarray]:
+        """Parse CSV rows into a 2D float array, None if not a numeric table."""
         try:
-            line.encode("ascii")
-        except UnicodeEncodeError:
+            return np.loadtxt(
+                rows, delimiter=",", dtype=np.float64, ndmin=2, comments=None
+            )
+        except ValueError:
+            return None
+
+    def _is_line_corrupted(self, line: bytes) -> bool:
+        """Check for obvious signs of line corruption."""
+        # Binary data or control characters outside of ASCII
+        if not line.isascii():
             return True
 
-        # Check for too many consecutive identical characters (likely corruption)
-        for i in range(len(line) - 5):
-            if len(set(line[i : i + 6])) == 1:  # 6 identical chars in a row
-                return True
+        # Too many consecutive identical characters (likely corruption)
+        if _REPEAT_RE.search(line):
+            return True
 
         # Check for unreasonable line length
         if len(line) > 500:  # Too long for normal CSV
@@ -269,185 +516,219 @@ class DataAcquisitionThread(QThread):
         return False
 
     def _process_line(self, line: str) -> None:
-        # Validate and filter the line before processing
-        if not self._validate_line(line):
-            Debug.debug(f"Invalid line rejected: {line[:50]}...")
+        # Cheap structural checks shared by header and data lines
+        parts = line.split(",")
+        if len(line) < 10 or len(parts) < 6:
+            if debug_enabled():
+                debug(f"Invalid line rejected: {line[:50]}...")
             return
 
         if not self._header_detected:
             if self._parse_header(line):
                 return
-            parts = [p.strip() for p in line.split(",")]
-            if self._maybe_infer_numeric_header(parts):
-                pass
-            else:
+            if not self._maybe_infer_numeric_header(parts):
                 return
-        else:
-            parts = [p.strip() for p in line.split(",")]
-        if len(parts) < 2:
-            Debug.debug(f"Line too short ({len(parts)} parts): {line[:30]}...")
+            # Header inferred from this all-numeric line
+            self._emit_data(list(map(float, parts)))
             return
-        self._emit_data(parts)
 
-    def _validate_line(self, line: str) -> bool:
-        """Validate that a line contains proper data format."""
-        if not line or not line.strip():
-            return False
+        values = self._parse_values(parts)
+        if values is None:
+            if debug_enabled():
+                debug(f"Invalid line rejected: {line[:50]}...")
+            return
+        self._emit_data(values)
 
-        # Check for minimum length
-        if len(line.strip()) < 10:
-            return False
+    def _parse_values(self, parts: List[str]) -> Optional[List[float]]:
+        """Convert and validate the fields of a data line in a single pass.
 
-        # Must contain commas for CSV format
-        if "," not in line:
-            return False
+        Every field is converted with ``float()`` exactly once. Non-numeric
+        fields become NaN, as long as at least 80% of the fields are numeric.
+        Apart from the first (time) column, values must be finite and within
+        +/-10000.
 
-        # Split and validate parts
-        parts = [p.strip() for p in line.split(",")]
+        Args:
+            parts (List[str]): The comma separated fields of the line.
 
-        # Must have reasonable number of parts (at least 6 for basic gyroscope data)
-        if len(parts) < 6:
-            return False
+        Returns:
+            Optional[List[float]]: The parsed values, or None if the line has
+            to be rejected.
+        """
+        n_fields = self._layout.n_fields
+        if len(parts) != n_fields:
+            if debug_enabled():
+                debug(f"Field count mismatch: expected {n_fields}, got {len(parts)}")
+            return None
 
-        # If we already have a header, validate against expected field count
-        if self._header_detected and len(parts) != len(self._header):
-            Debug.debug(
-                f"Field count mismatch: expected {len(self._header)}, got {len(parts)}"
-            )
-            return False
+        try:
+            # Regular data lines are all-numeric and convert in one C-level pass
+            values = list(map(float, parts))
+        except ValueError:
+            return self._parse_mixed_values(parts)
+        # Skip range check for timestamp field; NaN/inf fail the comparison
+        for i in range(1, n_fields):
+            if not abs(values[i]) <= 10000:
+                if debug_enabled():
+                    debug(f"Value out of range: {values[i]} at position {i}")
+                return None
+        return values
 
-        # Validate that most parts are numeric (for data lines)
+    @staticmethod
+    def _parse_mixed_values(parts: List[str]) -> Optional[List[float]]:
+        """Field-by-field variant of ``_parse_values`` for non-numeric fields."""
+        values: List[float] = []
         numeric_count = 0
-        for part in parts:
-            if self._is_number(part):
-                numeric_count += 1
+        for i, part in enumerate(parts):
+            try:
+                value = float(part)
+            except ValueError:
+                values.append(nan)
+                continue
+            # Skip range check for timestamp field; NaN/inf fail the comparison
+            if i and not abs(value) <= 10000:
+                if debug_enabled():
+                    debug(f"Value out of range: {value} at position {i}")
+                return None
+            numeric_count += 1
+            values.append(value)
 
         # For data lines, at least 80% should be numeric
         if numeric_count / len(parts) < 0.8:
-            # Could be a header line, which is ok
-            if not self._header_detected:
-                return True
-            else:
-                return False
-
-        # Additional validation: check for reasonable value ranges
-        if self._header_detected:
-            return self._validate_data_ranges(parts)
+            return None
+        return values
 
+    def _maybe_infer_numeric_header(self, parts: List[str]) -> bool:
+        # Cheap length test first, then one regex match per field
+        if len(parts) < 8 or not all(map(_FLOAT_RE.fullmatch, parts)):
+            return False
+        self._header = self.DEFAULT_HEADER_BASIC[: len(parts)]
+        self._header_detected = True
+        self._layout = _HeaderLayout(self._header)
+        info(f"Header fallback inferred (numeric): {self._header}")
         return True
 
-    def _validate_data_ranges(self, parts: List[str]) -> bool:
-        """Validate that numeric values are within reasonable ranges."""
-        try:
-            for i, part in enumerate(parts):
-                if not self._is_number(part):
-                    continue
-
-                value = float(part)
-
-                # Skip timestamp/frequency fields (usually first field)
-                if i == 0:
-                    continue
+    def _emit_data(self, values: List[float]) -> None:
+        # Every caller passes at least layout.n_fields values, so a resolved
+        # index is always in range and only missing columns (-1) need a check;
+        # missing and non-numeric values are NaN
+        layout = self._layout
+        time_idx, freq_idx = layout.time, layout.freq
+        accel_idx, gyro_idx = layout.accel_z, layout.gyro_z
 
-                # Check for obviously invalid values
-                if abs(value) > 10000:  # Extreme values
-                    Debug.debug(f"Value out of range: {value} at position {i}")
-                    return False
+        # Elapsed time computation from 'Current Time'
+        if time_idx < 0:
+            # Fallback: synthesize from internal counter (legacy)
+            elapsed_sec = float(self._index)
+        else:
+            current_time_raw = values[time_idx]
+            if not isfinite(current_time_raw):
+                # Unreadable time value: drop only this row, the time base and
+                # the jump reference (_last_elapsed_sec) stay untouched
+                if debug_enabled():
+                    debug(f"Invalid time value {current_time_raw} - SKIPPING POINT")
+                self._index += 1
+                return
+            elapsed_sec = self._elapsed_from_raw(current_time_raw)
+            if elapsed_sec is None:
+                return
 
-                # Check for NaN or infinite values
-                if not (value == value) or abs(value) == float("inf"):  # NaN check
-                    Debug.debug(f"Invalid numeric value: {value} at position {i}")
-                    return False
+        # Get frequency directly from the data stream
+        self._emit_sample(
+            elapsed_sec,
+            values[freq_idx] if freq_idx >= 0 else nan,
+            values[accel_idx] if accel_idx >= 0 else nan,
+            values[gyro_idx] if gyro_idx >= 0 else nan,
+        )
 
-            return True
-        except Exception as e:
-            Debug.debug(f"Data validation error: {e}")
-            return False
+    def _elapsed_from_raw(self, current_time_raw: float) -> Optional[float]:
+        """Convert a raw 'Current Time' value to elapsed seconds.
 
-    def _maybe_infer_numeric_header(self, parts: List[str]) -> bool:
-        if not parts:
-            return False
-        if all(self._is_number(p) for p in parts) and len(parts) >= 8:
-            self._header = self.DEFAULT_HEADER_BASIC[: len(parts)]
-            self._header_detected = True
-            Debug.info(f"Header fallback inferred (numeric): {self._header}")
-            return True
-        return False
+        Args:
+            current_time_raw (float): Device time in milliseconds.
 
-    def _emit_data(self, parts: List[str]) -> None:
-        header_map = {n.lower(): i for i, n in enumerate(self._header)}
+        Returns:
+            Optional[float]: Elapsed seconds since the time base, or None if
+            the point has to be skipped because time jumped backwards.
+        """
+        # If this is the first time we see a current_time value since a reset,
+        # initialise the time base and explicitly emit elapsed = 0.0 to avoid
+        # race conditions where an upstream point appears before the UI
+        # has recorded the measurement start.
+        if self._time_base_raw < 0:
+            self._time_base_raw = current_time_raw
+            elapsed_sec = 0.0
+            raw_delta = 0.0
+        else:
+            raw_delta = current_time_raw - self._time_base_raw
 
-        def getf(name: str) -> Optional[float]:
-            idx = header_map.get(name.lower())
-            if idx is None or idx >= len(parts):
-                return None
-            try:
-                value = float(parts[idx])
-                return value
-            except Exception:
+            # Detect time jumps backwards (e.g., mock server loop restart)
+            # If time goes backwards significantly, skip this point
+            if raw_delta < 0 or raw_delta < (self._last_elapsed_sec * 1_000.0 - 1000):
+                if debug_enabled():
+                    debug(
+                        f"Time jump detected: raw={current_time_raw}µs, base={self._time_base_raw}µs, "
+                        f"delta={raw_delta}µs, last_elapsed={self._last_elapsed_sec:.6f}s - SKIPPING POINT"
+                    )
+                self._index += 1
                 return None
 
-        # Get frequency directly from the data stream
-        frequency = getf("Frequency")
-        accel_x = getf("Acceleration X")
-        accel_y = getf("Acceleration Y")
-        accel_z = getf("Acceleration Z")
-        gyro_x = getf("Gyro X")
-        gyro_y = getf("Gyro Y")
-        gyro_z = getf("Gyro Z")
+            # Arduino sends time in milliseconds - always convert to seconds
+            # Fixed conversion: millisekunden / 1_000 = seconds
+            elapsed_sec = raw_delta / 1_000.0
 
-        # Elapsed time computation from 'Current Time'
-        current_time_raw = getf("Current Time")
-        if current_time_raw is not None:
-            # If this is the first time we see a current_time value since a reset,
-            # initialise the time base and explicitly emit elapsed = 0.0 to avoid
-            # race conditions where an upstream point appears before the UI
-            # has recorded the measurement start.
-            if self._time_base_raw is None:
-                self._time_base_raw = current_time_raw
-                elapsed_sec = 0.0
-                raw_delta = 0.0
-            else:
-                raw_delta = current_time_raw - self._time_base_raw
+        # Debug log for the first few conversions to help diagnose unit/ordering issues
+        if self._time_debug_count < 12:
+            debug(
+                f"Time conversion idx={self._index}: raw={current_time_raw}µs, base={self._time_base_raw}µs, delta={raw_delta}µs, elapsed={elapsed_sec:.6f}s, last_elapsed={self._last_elapsed_sec:.6f}s"
+            )
+            self._time_debug_count += 1
+        return elapsed_sec
 
-                # Detect time jumps backwards (e.g., mock server loop restart)
-                # If time goes backwards significantly, skip this point
-                if raw_delta < 0 or raw_delta < (
-                    self._last_elapsed_sec * 1_000.0 - 1000
-                ):
-                    Debug.debug(
-                        f"Time jump detected: raw={current_time_raw}µs, base={self._time_base_raw}µs, "
-                        f"delta={raw_delta}µs, last_elapsed={self._last_elapsed_sec:.6f}s - SKIPPING POINT"
-                    )
-                    self._index += 1
-                    return
+    def _elapsed_block(self, raw_times: np.ndarray) -> Optional[np.ndarray]:
+        """Convert a column of raw 'Current Time' values to elapsed seconds.
 
-                # Ensure raw_delta is non-negative after check
-                raw_delta = max(0.0, raw_delta)
+        Vectorised form of :meth:`_elapsed_from_raw` for the common case of a
+        running time base without backward jumps.
 
-                # Arduino sends time in milliseconds - always convert to seconds
-                # Fixed conversion: millisekunden / 1_000 = seconds
-                elapsed_sec = raw_delta / 1_000.0
+        Args:
+            raw_times (np.ndarray): Device times in milliseconds.
 
-            # Debug log for the first few conversions to help diagnose unit/ordering issues
-            try:
-                dbg_count = getattr(self, "_time_debug_count", 0)
-                if dbg_count < 12:
-                    Debug.debug(
-                        f"Time conversion idx={self._index}: raw={current_time_raw}µs, base={self._time_base_raw}µs, delta={raw_delta}µs, elapsed={elapsed_sec:.6f}s, last_elapsed={self._last_elapsed_sec:.6f}s"
-                    )
-                    self._time_debug_count = dbg_count + 1
-            except Exception:
-                # Defensive: don't let debug formatting break acquisition
-                pass
-        else:
-            # Fallback: synthesize from internal counter (legacy)
-            elapsed_sec = float(self._index)
+        Returns:
+            Optional[np.ndarray]: Elapsed seconds per row, or None if the
+            block needs the sequential per-row handling (no time base yet,
+            conversion still logged, a non-finite time value or a time jump
+            inside the block).
+        """
+        if self._time_base_raw < 0 or self._time_debug_count < 12:
+            return None
+        # NaN/inf times would slip through the jump check below (comparisons
+        # are False); the per-row path skips exactly those rows
+        if not np.isfinite(raw_times).all():
+            return None
+        raw_delta = raw_times - self._time_base_raw
+        elapsed = raw_delta / 1_000.0
+
+        # Same jump check as the per-row path, each row against its predecessor
+        last_elapsed = np.empty_like(elapsed)
+        last_elapsed[0] = self._last_elapsed_sec
+        last_elapsed[1:] = elapsed[:-1]
+        if (raw_delta < 0).any() or (raw_delta < last_elapsed * 1_000.0 - 1000).any():
+            return None
+        return elapsed
+
+    def _emit_sample(
+        self,
+        elapsed_sec: float,
+        frequency: float,
+        accel_z: float,
+        gyro_z: float,
+    ) -> None:
+        """Emit one sample; missing values are NaN."""
         self._last_elapsed_sec = elapsed_sec
 
         # Discard the very first point after a reset to avoid displaying old values
         if self._skip_first_point:
-            Debug.debug(
+            debug(
                 f"Discarding first point after reset: elapsed={elapsed_sec:.6f}s, freq={frequency}, gyro_z={gyro_z}"
             )
             self._skip_first_point = False
@@ -457,49 +738,242 @@ class DataAcquisitionThread(QThread):
         # Primary value is frequency if available, otherwise accel_z, then gyro_z
         primary = (
             frequency
-            if frequency is not None
-            else (accel_z if accel_z is not None else gyro_z)
+            if not isnan(frequency)
+            else (accel_z if not isnan(accel_z) else gyro_z)
         )
-        if primary is None:
+        if isnan(primary):
             return
 
-        self.data_point.emit(float(elapsed_sec), float(primary))
+        if self.emit_points:
+            self.data_point.emit(elapsed_sec, primary)
 
-        # Send all 8 data values but only pass specific ones to plots
-        self.multi_data_point.emit(
-            float(elapsed_sec),
-            float(frequency) if frequency is not None else nan,
-            float(accel_z) if accel_z is not None else nan,
-            float(gyro_z) if gyro_z is not None else nan,
-        )
+            # Send all 8 data values but only pass specific ones to plots
+            self.multi_data_point.emit(elapsed_sec, frequency, accel_z, gyro_z)
+
+        # Collect the same sample for the batched signal
+        n = self._batch_n
+        if not n:
+            self._batch_started = time.monotonic()
+        self._batch[n] = (elapsed_sec, frequency, accel_z, gyro_z)
+        self._batch_n = n + 1
+        if self._batch_n == self.BATCH_SIZE:
+            self._flush_batch()
         self._index += 1  # still increment for potential fallback use
 
-    def _periodic_log(self) -> None:
-        """Log the current state every 5 seconds."""
-        now = time.time()
+    def _emit_block(
+        self,
+        elapsed: np.ndarray,
+        frequency: Optional[np.ndarray],
+        accel_z: Optional[np.ndarray],
+        gyro_z: Optional[np.ndarray],
+    ) -> None:
+        """Vectorised :meth:`_emit_sample` for a block of validated rows.
+
+        Only collects into ``multi_data_batch``, so it is used while
+        ``emit_points`` is off. Missing columns are passed as None.
+        """
+        self._last_elapsed_sec = float(elapsed[-1])
+
+        if self._skip_first_point:
+            debug(
+                f"Discarding first point after reset: elapsed={elapsed[0]:.6f}s, "
+                f"freq={None if frequency is None else frequency[0]}, "
+                f"gyro_z={None if gyro_z is None else gyro_z[0]}"
+            )
+            self._skip_first_point = False
+            self._index += 1
+            elapsed = elapsed[1:]
+            frequency = None if frequency is None else frequency[1:]
+            accel_z = None if accel_z is None else accel_z[1:]
+            gyro_z = None if gyro_z is None else gyro_z[1:]
+
+        n = len(elapsed)
+        # Without any value column every sample lacks a primary value
+        if not n or (frequency is None and accel_z is None and gyro_z is None):
+            return
+
+        block = np.empty((n, 4), dtype=np.float64)
+        block[:, 0] = elapsed
+        block[:, 1] = nan if frequency is None else frequency
+        block[:, 2] = nan if accel_z is None else accel_z
+        block[:, 3] = nan if gyro_z is None else gyro_z
+
+        # Fill the pending batch, flushing each time it is full
+        size = self.BATCH_SIZE
+        start = 0
+        while start < n:
+            filled = self._batch_n
+            if not filled:
+                self._batch_started = time.monotonic()
+            count = min(n - start, size - filled)
+            self._batch[filled : filled + count] = block[start : start + count]
+            self._batch_n = filled + count
+            start += count
+            if self._batch_n == size:
+                self._flush_batch()
+        self._index += n
+
+    def _flush_batch(self) -> None:
+        """Emit all pending samples as one multi_data_batch."""
+        n = self._batch_n
+        if n:
+            self._batch_n = 0
+            self.multi_data_batch.emit(self._batch[:n].copy(order="F"))
+
+    def _periodic_log(self, now: float) -> None:
+        """Log the current state every 5 seconds.
+
+        Args:
+            now (float): ``time.monotonic()`` of the current wake-up.
+        """
         if now - self._last_log > 5.0:
-            Debug.debug(
+            debug(
                 f"CSV acquisition active: t={self._last_elapsed_sec:.3f}s, lines={self._index}"
             )
             self._last_log = now
 
     def reset_index(self) -> None:
-        """Reset the index and time base for a new measurement."""
-        Debug.debug(
+        """Reset the index and time base for a new measurement.
+
+        While the thread is running, the reset is only requested here and
+        applied by ``run()`` before it parses the next data, so it never
+        interleaves with a half-written batch.
+        """
+        debug(
             "DataAcquisitionThread.reset_index() called - clearing time base and counters"
         )
+        if self.isRunning():
+            self._reset_requested = True
+        else:
+            self._apply_reset()
+
+    def _apply_reset(self) -> None:
+        self._reset_requested = False
         self._index = 0
-        self._time_base_raw = None
+        self._time_base_raw = -1.0
         self._last_elapsed_sec = 0.0
         self._skip_first_point = True  # Discard the very first point after reset
+        self._batch_n = 0  # Drop samples still pending from before the reset
 
     def stop(self) -> None:
         """Stop the acquisition thread."""
         self._running = False
         self.requestInterruption()
+        # Wake the run loop if it is waiting for data
+        self._rx_queue.put(bytearray())
         self.wait(2000)
 
 
+class _DatagramReceiver(QThread):
+    """Receiver thread feeding raw UDP payload to a DataAcquisitionThread.
+
+    Only reads from the socket and queues the payload, so datagrams keep
+    being drained while the acquisition thread parses and emits.
+    """
+
+    def __init__(self, acquisition: DataAcquisitionThread) -> None:
+        super().__init__()
+        self._acquisition = acquisition
+        self._running = False
+        # Socket pair registered next to the UDP socket so stop() can wake
+        # a select() that is blocked for up to IDLE_WAIT
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+
+    def run(self) -> None:  # noqa: D401
+        self._running = True
+        manager = self._acquisition.manager
+        # Hot-loop lookups bound once
+        receive = self._acquisition._receive_chunk
+        rx_queue = self._acquisition._rx_queue
+        put = rx_queue.put
+        pending = rx_queue.qsize
+        queue_max = self._acquisition.RX_QUEUE_MAX
+        dropped = 0
+        sleep = time.sleep
+        interrupted = self.isInterruptionRequested
+        idle_wait = self._acquisition.IDLE_WAIT
+        # Wait for readability in the selector instead of a socket timeout,
+        # so the thread wakes as soon as a datagram arrives
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        select = selector.select
+        sock = None
+        while self._running and not interrupted():
+            if not manager.connected:
+                sleep(0.05)
+                continue
+            # Check if connection changed (after reconnect)
+            if sock != manager.connection:
+                if sock is not None:
+                    debug("Socket changed - updating reference")
+                    self._unregister(selector, sock)
+                sock = manager.connection
+                if not sock:
+                    sleep(0.05)
+                    continue
+                sock.setblocking(False)
+                selector.register(sock, selectors.EVENT_READ)
+            try:
+                if not sock or sock.fileno() == -1:
+                    sleep(0.05)
+                    continue
+                if not select(idle_wait):
+                    continue
+                data = receive(sock)
+                if data:
+                    if pending() >= queue_max:
+                        # Parser fell behind: drop the oldest chunk instead
+                        # of letting the queue grow without bound
+                        try:
+                            rx_queue.get_nowait()
+                        except queue.Empty:
+                            pass
+                        dropped += 1
+                        if dropped == 1 or not dropped % 1000:
+                            error(f"Receive queue overrun, {dropped} chunks dropped")
+                    put(data)
+            except Exception as exc:  # pragma: no cover
+                error(f"UDP receive error: {exc}")
+                time.sleep(0.01)
+        selector.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+    @staticmethod
+    def _unregister(selector: selectors.BaseSelector, sock: socket.socket) -> None:
+        """Remove a (possibly already closed) socket from the selector."""
+        try:
+            selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+
+    def stop(self) -> None:
+        """Stop the receiver thread."""
+        self._running = False
+        self.requestInterruption()
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # Already closed by a finished run()
+        self.wait(1000)
+
+
+def parse_host_port(ip: str) -> Tuple[str, int]:
+    """Parse host:port from a string. Supports forms like 'host:port', 'http://host:port', '[ipv6]:port'."""
+    ip = ip.strip()
+    parts = urlsplit(ip if "://" in ip else f"udp://{ip}")
+    netloc = parts.netloc
+    if netloc.count(":") > 1 and not netloc.startswith("["):
+        # Bare IPv6 address, which cannot carry a port without []
+        return netloc, 80
+    try:
+        port = parts.port
+    except ValueError:  # Not a number or out of range
+        port = None
+    return parts.hostname or netloc, port or 80
+
+
 class DeviceManager(QObject):
     """Handle device connection and data acquisition."""
 
@@ -510,16 +984,25 @@ class DeviceManager(QObject):
     # Signal emitted when attempting reconnection
     reconnection_attempt = Signal(int)  # attempt number
 
+    # Requested kernel receive buffer for the UDP socket (the OS may cap it)
+    RCVBUF_SIZE = 12 * 1024 * 1024
+
     def __init__(
         self,
         status_callback: Optional[Callable[[str, str], None]] = None,
         data_callback: Optional[Callable[[float, float], None]] = None,
         multi_callback: Optional[Callable[[float, float, float, float], None]] = None,
+        batch_callback: Optional[Callable[[np.ndarray], None]] = None,
     ) -> None:
         super().__init__()
         self.status_callback = status_callback
         self.data_callback = data_callback
         self.multi_callback = multi_callback
+        # Receives multi_data_batch arrays (n, 4); the per-sample callbacks
+        # are served from the same batches by _fan_out_batch
+        self.batch_callback = batch_callback
+        # Callbacks already connected to the current acquisition thread
+        self._connected_callbacks: List[Callable] = []
         self.connected: bool = False
         self.connection: Optional[socket.socket] = None
         self.server_address: Optional[tuple] = None  # For UDP server address
@@ -549,10 +1032,10 @@ class DeviceManager(QObject):
                 # Connect to the server (doesn't actually send data for UDP)
                 temp_socket.connect((server_host, 80))  # Port doesn't matter for this
                 local_ip = temp_socket.getsockname()[0]
-                Debug.debug(f"Local IP for server {server_host}: {local_ip}")
+                debug(f"Local IP for server {server_host}: {local_ip}")
                 return local_ip
         except Exception as e:
-            Debug.debug(f"Could not determine local IP: {e}, using fallback")
+            debug(f"Could not determine local IP: {e}, using fallback")
             # Fallback: try to get any available IP
             try:
                 hostname = socket.gethostname()
@@ -564,37 +1047,44 @@ class DeviceManager(QObject):
 
     def connect_device(self, ip: str, timeout: float) -> bool:
         """Connect via UDP to the device with unicast handshake."""
-        host, port = self._parse_host_port(ip)
+        host, port = parse_host_port(ip)
         try:
-            Debug.debug(
+            debug(
                 f"Attempting to connect via UDP to {host}:{port} with timeout {timeout}"
             )
 
             # Create UDP socket and bind to same port to receive unicast data
             self.connection = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.connection.settimeout(timeout)
+            # Larger kernel receive buffer to absorb bursts without dropping datagrams
+            try:
+                self.connection.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, self.RCVBUF_SIZE
+                )
+                # The kernel may silently cap the request (net.core.rmem_max)
+                effective = self.connection.getsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF
+                )
+                debug(
+                    f"Socket receive buffer: {effective} bytes "
+                    f"(requested {self.RCVBUF_SIZE})"
+                )
+            except OSError as e:
+                debug(f"Could not enlarge socket receive buffer: {e}")
 
-            # Bind to the same port as the server to receive unicast data
+            # Bind to the same port as the server to receive unicast data.
+            # No SO_REUSEADDR/SO_REUSEPORT: a second socket on the same port
+            # would silently take a share of the device's datagrams
             try:
                 self.connection.bind(("", port))
-                Debug.debug(f"Client bound to port {port} for unicast reception")
+                debug(f"Client bound to port {port} for unicast reception")
             except OSError as e:
-                # If port is busy, wait a bit and try again
-                Debug.debug(f"Port {port} busy ({e}), waiting and retrying...")
-                time.sleep(0.2)
-                try:
-                    self.connection.bind(("", port))
-                    Debug.debug(
-                        f"Client bound to port {port} for unicast reception (retry successful)"
-                    )
-                except OSError as e2:
-                    # If still busy, try auto-assignment
-                    Debug.debug(
-                        f"Could not bind to port {port} after retry: {e2}, trying auto-assignment"
-                    )
-                    self.connection.bind(("", 0))  # Let OS assign a port
-                    bound_port = self.connection.getsockname()[1]
-                    Debug.debug(f"Client bound to auto-assigned port {bound_port}")
+                # Port busy: let the OS assign one instead of waiting and
+                # retrying, the server learns the port from the connect signal
+                debug(f"Could not bind to port {port}: {e}, trying auto-assignment")
+                self.connection.bind(("", 0))  # Let OS assign a port
+                bound_port = self.connection.getsockname()[1]
+                debug(f"Client bound to auto-assigned port {bound_port}")
 
             # Store server address for later use
             self.server_address = (host, port)
@@ -604,12 +1094,12 @@ class DeviceManager(QObject):
             client_port = self.connection.getsockname()[1]
 
             # Send connect signal to inform server about unicast client
-            Debug.debug(f"Sending connect signal from {client_ip}:{client_port}")
+            debug(f"Sending connect signal from {client_ip}:{client_port}")
             connect_msg = f"CONNECT:{client_ip}:{client_port}".encode("utf-8")
             self.connection.sendto(connect_msg, self.server_address)
 
             # Test connection by waiting for actual data
-            Debug.debug("Waiting for data to verify connection...")
+            debug("Waiting for data to verify connection...")
             data_received = False
             test_start_time = time.time()
             test_timeout = min(timeout, 3.0)  # Maximum 3 seconds for data test
@@ -620,20 +1110,20 @@ class DeviceManager(QObject):
                     self.connection.settimeout(0.5)
                     data, addr = self.connection.recvfrom(4096)
                     if data:
-                        Debug.debug(f"Data received from {addr}: {len(data)} bytes")
+                        debug(f"Data received from {addr}: {len(data)} bytes")
                         data_received = True
                         break
                 except socket.timeout:
                     continue
                 except Exception as e:
-                    Debug.debug(f"Error during data test: {e}")
+                    debug(f"Error during data test: {e}")
                     break
 
             # Reset socket timeout for normal operation
             self.connection.settimeout(timeout)
 
             if not data_received:
-                Debug.error("No data received - connection test failed")
+                error("No data received - connection test failed")
                 self.connection.close()
                 self.connection = None
                 if self.status_callback:
@@ -657,38 +1147,19 @@ class DeviceManager(QObject):
             return True
 
         except Exception as e:  # pragma: no cover - network dependent
-            Debug.error("UDP connection failed", e)
+            error("UDP connection failed", e)
             self.connected = False
+            # Don't leave a bound socket behind that would share the port
+            if self.connection:
+                try:
+                    self.connection.close()
+                except OSError:
+                    pass
+                self.connection = None
             if self.status_callback:
                 self.status_callback(f"UDP connection failed: {e}", "red")
             return False
 
-    def _parse_host_port(self, ip: str) -> Tuple[str, int]:
-        """Parse host:port from a string. Supports forms like 'host:port', 'http://host:port', '[ipv6]:port'."""
-        ip = ip.strip()
-        # Remove scheme
-        if "://" in ip:
-            ip = ip.split("://", 1)[1]
-        # IPv6 wrapped in []
-        if ip.startswith("["):
-            host, rest = ip.split("]", 1)
-            host = host[1:]
-            if rest.startswith(":"):
-                port = int(rest[1:])
-            else:
-                port = 80
-            return host, port
-        # Regular host:port
-        if ip.count(":") == 1:
-            host, port_s = ip.split(":", 1)
-            try:
-                port = int(port_s)
-            except ValueError:
-                port = 80
-            return host, port
-        # Host only
-        return ip, 80
-
     def disconnect_device(self) -> None:
         """Close existing connection and stop acquisition."""
         self.stop_acquisition()
@@ -703,24 +1174,60 @@ class DeviceManager(QObject):
     def start_acquisition(self) -> bool:
         """Start or (re)connect the acquisition thread."""
         if self.acquire_thread and self.acquire_thread.isRunning():
-            if self.data_callback:
-                # Ensure our callback is connected even if the thread was
-                # started before the callback was assigned.
-                self.acquire_thread.data_point.connect(self.data_callback)
-            if self.multi_callback:
-                self.acquire_thread.multi_data_point.connect(self.multi_callback)
+            # Ensure our callbacks are connected even if the thread was
+            # started before the callbacks were assigned.
+            self._connect_callbacks()
             return True
 
         self.acquire_thread = DataAcquisitionThread(self)
-        if self.data_callback:
-            self.acquire_thread.data_point.connect(self.data_callback)
-        if self.multi_callback:
-            self.acquire_thread.multi_data_point.connect(self.multi_callback)
+        self._connected_callbacks = []
+        self._connect_callbacks()
         # Connect connection lost signal to our handler
         self.acquire_thread.connection_lost.connect(self._handle_connection_lost)
-        self.acquire_thread.start()
+        # Above the GUI thread, so a busy UI does not stall parsing
+        self.acquire_thread.start(QThread.HighPriority)
         return True
 
+    def _connect_callbacks(self) -> None:
+        """Connect the assigned data callbacks to the acquisition thread.
+
+        Each callback is connected once per thread. The per-sample callbacks
+        are fed from multi_data_batch through _fan_out_batch, so only one
+        cross-thread signal is delivered per batch and the thread does not
+        need to emit its per-sample signals.
+        """
+        thread = self.acquire_thread
+        fan_out = (
+            self._fan_out_batch
+            if self.data_callback or self.multi_callback
+            else None
+        )
+        for callback in (self.batch_callback, fan_out):
+            if callback and callback not in self._connected_callbacks:
+                thread.multi_data_batch.connect(callback)
+                self._connected_callbacks.append(callback)
+        thread.emit_points = False
+
+    def _fan_out_batch(self, batch: np.ndarray) -> None:
+        """Call the per-sample callbacks for every row of a multi_data_batch.
+
+        Args:
+            batch (np.ndarray): Rows of (elapsed_sec, freq, accel_z, gyro_z).
+        """
+        data_callback = self.data_callback
+        multi_callback = self.multi_callback
+        for elapsed_sec, frequency, accel_z, gyro_z in batch.tolist():
+            if data_callback:
+                # Same primary value as DataAcquisitionThread.data_point
+                primary = (
+                    frequency
+                    if not isnan(frequency)
+                    else (accel_z if not isnan(accel_z) else gyro_z)
+                )
+                data_callback(elapsed_sec, primary)
+            if multi_callback:
+                multi_callback(elapsed_sec, frequency, accel_z, gyro_z)
+
     def stop_acquisition(self) -> bool:
         """Stop the acquisition thread."""
         if self.acquire_thread and self.acquire_thread.isRunning():
@@ -743,11 +1250,11 @@ class DeviceManager(QObject):
                 try:
                     self.device.set_counting(True)
                 except (AttributeError, RuntimeError, OSError) as e:  # pragma: no cover
-                    Debug.error(f"Legacy set_counting failed: {e}")
+                    error(f"Legacy set_counting failed: {e}")
             self.measurement_active = True
             return True
         except (AttributeError, RuntimeError, OSError) as exc:  # pragma: no cover
-            Debug.error(f"Failed to start measurement: {exc}")
+            error(f"Failed to start measurement: {exc}")
             return False
 
     def stop_measurement(self) -> bool:
@@ -760,9 +1267,9 @@ class DeviceManager(QObject):
                 try:
                     self.device.set_counting(False)
                 except (AttributeError, RuntimeError, OSError) as e:  # pragma: no cover
-                    Debug.error(f"Legacy set_counting stop failed: {e}")
+                    error(f"Legacy set_counting stop failed: {e}")
         except (AttributeError, RuntimeError, OSError) as exc:  # pragma: no cover
-            Debug.error(f"Failed to stop measurement: {exc}")
+            error(f"Failed to stop measurement: {exc}")
         self.measurement_active = False
         return True
 
@@ -778,7 +1285,7 @@ class DeviceManager(QObject):
             set_primary_field("accel_magnitude")  # magnitude from X/Y/Z
         """
         self.primary_field_name = field_name
-        Debug.info(f"Primary field set: {field_name}")
+        info(f"Primary field set: {field_name}")
 
     def shutdown(self) -> None:
         """Shutdown the manager cleanly (idempotent)."""
@@ -797,7 +1304,7 @@ class DeviceManager(QObject):
 
     def _handle_connection_lost(self) -> None:
         """Handle connection loss detected by the acquisition thread."""
-        Debug.error("Connection lost - starting reconnection process")
+        error("Connection lost - starting reconnection process")
         self.connected = False
         if self.status_callback:
             self.status_callback("Connection lost - attempting reconnection...", "red")
@@ -828,7 +1335,7 @@ class DeviceManager(QObject):
             return
 
         ip, timeout = self.last_connection_params
-        Debug.info(
+        info(
             f"Attempting UDP reconnection to {ip} (attempt {self.reconnect_attempts}) - will send new connect signal"
         )
 
@@ -842,7 +1349,7 @@ class DeviceManager(QObject):
 
         # Try to reconnect (this will automatically send a new connect signal)
         if self.connect_device(ip, timeout):
-            Debug.info("UDP reconnection successful - connect signal sent to Arduino")
+            info("UDP reconnection successful - connect signal sent to Arduino")
             if self.status_callback:
                 self.status_callback("Reconnected successfully via UDP", "green")
             # Restart acquisition if it was running
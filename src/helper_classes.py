@@ -2,6 +2,7 @@ import re
 import csv
 import json
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Union, Optional
 from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
@@ -21,6 +22,33 @@ try:
 except ImportError:
     from debug_utils import Debug
 
+# Existing background color declaration in a status bar stylesheet
+_BGCOLOR_RE = re.compile(r"background-color:\s*[^;]+;")
+# Folder name validation and sanitizing
+_GROUP_LETTER_RE = re.compile(r"^[A-Z]$")
+_TK_RE = re.compile(r"^TK\d{1,2}$")
+_SANITIZE_SPECIAL_RE = re.compile(r"[^a-zA-Z0-9\s\-_äöüÄÖÜß]")
+_SANITIZE_RUN_RE = re.compile(r"[_\s]+")
+
+
+@lru_cache(maxsize=32)
+def _compose_style(old_style: str, backcolor: str) -> str:
+    """Return ``old_style`` with its background color set to ``backcolor``.
+
+    Args:
+        old_style: Current stylesheet of the status bar
+        backcolor: New background color
+
+    Returns:
+        str: The stylesheet with the replaced or appended background color
+    """
+    match = _BGCOLOR_RE.search(old_style)
+    if match:
+        # if old style had backcolor, replace it with the new one
+        return old_style.replace(match.group(0), f"background-color: {backcolor};")
+    # otherwise append the new backcolor
+    return old_style + f"background-color: {backcolor};"
+
 
 class Statusbar:
     """
@@ -37,6 +65,10 @@ class Statusbar:
             Displays a permanent message on the status bar.
         _update_statusbar_style(backcolor: str):
             Updates the style of the status bar.
+        _set_style(style: str):
+            Applies a stylesheet to the status bar if it changed.
+        _restore_state():
+            Restores the state saved before a temporary message.
         _save_state():
             Saves the current state of the status bar.
     """
@@ -44,6 +76,12 @@ class Statusbar:
     def __init__(self, statusbar: QStatusBar) -> None:
         self.statusbar = statusbar
         self.old_state: list[str] = []
+        # State to restore after temporary messages; one reusable timer,
+        # restarted by every temporary message, restores it
+        self._temp_base: tuple[str, str] = ("", "")
+        self._reset_timer = QTimer(statusbar)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.timeout.connect(self._restore_state)
         self._save_state()
 
     def temp_message(
@@ -51,26 +89,26 @@ class Statusbar:
     ) -> None:
         new_style = self._update_statusbar_style(backcolor)
         # set statusbar style
-        self.statusbar.setStyleSheet(new_style)
+        self._set_style(new_style)
 
         # Set new message and if duration is provided, reset after the duration elapses
         if duration != 0:
             self.statusbar.showMessage(message, duration)
             Debug.info(f"Statusbar message: {message} with duration: {duration}")
-            # reset to old state after duration
-            QTimer.singleShot(
-                duration, lambda: self.statusbar.setStyleSheet(self.old_state[1])
-            )
-            QTimer.singleShot(
-                duration, lambda: self.statusbar.showMessage(self.old_state[0])
-            )
+            # reset to old state after duration; chained temporary messages
+            # restart the timer and all return to the state before the first
+            if not self._reset_timer.isActive():
+                self._temp_base = (self.old_state[0], self.old_state[1])
+            self._reset_timer.start(duration)
         else:
+            # A permanent message must not be reset by a pending timer
+            self._reset_timer.stop()
             self.statusbar.showMessage(message)
             Debug.info(f"Permanent Statusbar message: {message}")
 
     def perm_message(self, message: str, index: int = 0, backcolor: str = "") -> None:
         new_style = self._update_statusbar_style(backcolor)
-        self.statusbar.setStyleSheet(new_style)
+        self._set_style(new_style)
         label = QLabel()
         label.setText(message)
         self.statusbar.insertPermanentWidget(index, label)
@@ -82,26 +120,25 @@ class Statusbar:
 
         # Set new style if backcolor is provided or keep the old style
         if backcolor:
-            if "background-color:" in self.old_state[1]:
-                # if old style had backcolor, replace it with the new one
-                new_style = self.old_state[1].replace(
-                    re.search(r"background-color:\s*[^;]+;", self.old_state[1]).group(
-                        0
-                    ),
-                    f"background-color: {backcolor};",
-                )
-                Debug.info(
-                    f"Statusbar background color updated: {self.old_state[1]} -> {new_style}"
-                )
-            else:
-                # otherwise append the new backcolor
-                new_style = self.old_state[1] + f"background-color: {backcolor};"
-                Debug.info(f"Statusbar background color set: {new_style}")
+            new_style = _compose_style(self.old_state[1], backcolor)
+            Debug.info(
+                f"Statusbar background color updated: {self.old_state[1]} -> {new_style}"
+            )
         else:
             new_style = self.old_state[1]
             Debug.info("No background color change")
         return new_style
 
+    def _set_style(self, style: str) -> None:
+        # setStyleSheet re-polishes the widget even for an identical sheet
+        if style != self.statusbar.styleSheet():
+            self.statusbar.setStyleSheet(style)
+
+    def _restore_state(self) -> None:
+        message, style = self._temp_base
+        self._set_style(style)
+        self.statusbar.showMessage(message)
+
     def _save_state(self):
         self.old_state = [self.statusbar.currentMessage(), self.statusbar.styleSheet()]
 
@@ -176,9 +213,7 @@ class AlertWindow(QDialog):
                 button = self.ui.buttonBox.addButton(button_text, role)
                 # Add button click handler
                 button.clicked.connect(
-                    lambda checked=False, b=button, r=role, t=button_text: self._handle_button_clicked(
-                        b, r, t
-                    )
+                    partial(self._handle_button_clicked, button, role, button_text)
                 )
 
             # Connect generic dialog events with our button tracking
@@ -187,8 +222,11 @@ class AlertWindow(QDialog):
             if old_rejected:
                 self.ui.buttonBox.rejected.connect(self.reject)
 
-    def _handle_button_clicked(self, button, role, text):
-        """Store information about the clicked button."""
+    def _handle_button_clicked(self, button, role, text, _checked=False):
+        """Store information about the clicked button.
+
+        ``_checked`` receives the bool argument of the clicked signal.
+        """
         Debug.info(f"Button geklickt: {text} mit Rolle {role}")
         self.clicked_button = button
         self.clicked_role = role
@@ -394,9 +432,13 @@ class SaveManager:
         csv_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
+            text = self._format_csv(data)
             with open(csv_path, "w", newline="", encoding="utf-8") as csv_f:
-                writer = csv.writer(csv_f)
-                writer.writerows(data)
+                if text is None:
+                    writer = csv.writer(csv_f)
+                    writer.writerows(data)
+                else:
+                    csv_f.write(text)
             # Metadata saving disabled - uncomment if needed in future
             # metadata_path = csv_path.parent / (csv_path.stem + "_MD.json")
             # with open(metadata_path, "w", encoding="utf-8") as js_f:
@@ -407,6 +449,39 @@ class SaveManager:
             Debug.error(f"Failed to save measurement: {exc}", exc_info=exc)
         return csv_path
 
+    @staticmethod
+    def _format_csv(data: list[list[str]]) -> Optional[str]:
+        """Format rows exactly like ``csv.writer`` when no quoting is needed.
+
+        Joining plain string fields is several times faster than the
+        writer's per-field quoting checks. Rows are checked in bulk after
+        joining; anything the writer would quote (delimiter, quote char or
+        line breaks in a field, a single empty field) or convert
+        (non-string values) returns None, so the caller falls back to
+        ``csv.writer``.
+
+        Args:
+            data: The CSV rows
+
+        Returns:
+            Optional[str]: The CSV text with ``\\r\\n`` line endings, or None
+        """
+        try:
+            lines = [",".join(row) for row in data]
+        except TypeError:
+            return None
+        if "" in lines:
+            return None
+        text = "\r\n".join(lines)
+        if (
+            '"' in text
+            or text.count(",") != sum(map(len, data)) - len(data)
+            or text.count("\n") != len(lines) - 1
+            or text.count("\r") != len(lines) - 1
+        ):
+            return None
+        return text + "\r\n" if lines else text
+
     def auto_save_measurement(
         self,
         measurement_name: str,
@@ -479,22 +554,28 @@ class SaveManager:
 
     def _create_group_name(self, letter: str) -> str:
         """Create a group name based on the letter."""
+        # One clock read, so semester, day and year always belong together
+        now = datetime.now()
         semester = "SoSe"
-        if datetime.now().month >= 10 and datetime.now().month <= 12:
+        if 10 <= now.month <= 12:
             semester = "WiSe"
-        day = datetime.now().strftime("%a")[:2]
-        year = datetime.now().year
+        day = now.strftime("%a")[:2]
+        year = now.year
 
-        if not letter or not re.match(r"^[A-Z]$", letter):
+        if not letter or not _GROUP_LETTER_RE.match(letter):
             Debug.error(f"Invalid group letter: {letter}")
             return "Ungültige Gruppe"
 
         return f"{semester}{year}_{day}_{letter.upper()}"
 
 
+@lru_cache(maxsize=256)
 def sanitize_subterm_for_folder(subterm: str, max_length: int = 20) -> str:
     """Sanitize and shorten subterm for use in folder names.
 
+    The function is pure, so results are cached per (subterm, max_length);
+    a group usually saves many measurements under the same subterm.
+
     - Replaces special characters with underscores
     - Limits length to max_length characters
     - If too long, abbreviates each word to first 3 letters
@@ -512,10 +593,10 @@ def sanitize_subterm_for_folder(subterm: str, max_length: int = 20) -> str:
 
     # Replace special characters with underscores
     # Keep only alphanumeric, spaces, hyphens, and underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9\s\-_äöüÄÖÜß]", "_", subterm)
+    sanitized = _SANITIZE_SPECIAL_RE.sub("_", subterm)
 
     # Replace multiple consecutive underscores/spaces with single underscore
-    sanitized = re.sub(r"[_\s]+", "_", sanitized)
+    sanitized = _SANITIZE_RUN_RE.sub("_", sanitized)
 
     # Remove leading/trailing underscores
     sanitized = sanitized.strip("_")
@@ -552,10 +633,10 @@ def create_dropbox_foldername(
     """
 
     day = datetime.now().strftime("%a")[:2]
-    if not group_letter or not re.match(r"^[A-Z]$", group_letter):
+    if not group_letter or not _GROUP_LETTER_RE.match(group_letter):
         Debug.error(f"Invalid group letter: {group_letter}")
         return ""
-    if not tk_designation or not re.match(r"^TK\d{1,2}$", tk_designation):
+    if not tk_designation or not _TK_RE.match(tk_designation):
         Debug.error(f"Invalid TK designation: {tk_designation}")
         return ""
     folder_name = f"{day}{group_letter.upper()}{tk_designation}"
@@ -564,17 +645,19 @@ def create_dropbox_foldername(
     return folder_name
 
 
+@lru_cache(maxsize=8)
 def import_config(language: str = "de") -> dict:
     """
     Imports the language-specific configuration from config.json.
+
+    The file is read once per language; all callers share the returned
+    dictionary, so it must be treated as read-only.
+
     Args:
         language (str): The language code to load the configuration for (default is "de").
     Returns:
         dict: The configuration dictionary.
     """
-    import os
-    from pathlib import Path
-
     # Try multiple locations for config.json
     config_locations = [
         # Current working directory (for running from source)
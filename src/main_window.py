@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (  # pylint: disable=no-name-in-module
     QApplication,
     QWidget,
 )
-from PySide6.QtCore import QTimer  # pylint: disable=no-name-in-module
+from PySide6.QtCore import Qt, QTimer  # pylint: disable=no-name-in-module
 from PySide6 import QtGui
 from .device_manager import DeviceManager
 from .plot import PlotWidget
@@ -85,8 +85,8 @@ class MainWindow(QMainWindow):
     def _setup_device_manager(self, device_manager: DeviceManager):
         """Configure the device manager and attach callbacks (multi-channel)."""
         self.device_manager = device_manager
-        # Connect multi-channel callback; single value path kept unused
-        self.device_manager.multi_callback = self.handle_multi_data
+        # Connect batched multi-channel callback; per-sample paths kept unused
+        self.device_manager.batch_callback = self.handle_multi_batch
         self.device_manager.status_callback = self.statusbar.temp_message
 
         # Connect connection monitoring signals
@@ -97,9 +97,9 @@ class MainWindow(QMainWindow):
 
         # Connect plot widget signal
         if hasattr(self, "plot_widget"):
-            # Ensure acquisition thread is running (continuous mode)
-            if not self.device_manager.acquire_thread:
-                self.device_manager.start_acquisition()
+            # Ensure acquisition thread is running (continuous mode); this
+            # also connects batch_callback to an already running thread
+            self.device_manager.start_acquisition()
 
             # Connect signals if thread is running
             if (
@@ -107,26 +107,17 @@ class MainWindow(QMainWindow):
                 and self.device_manager.acquire_thread.isRunning()
             ):
                 try:
-                    self.device_manager.acquire_thread.multi_data_point.connect(
-                        self.handle_multi_data
-                    )
-                    self.device_manager.acquire_thread.multi_data_point.connect(
-                        self.plot_widget.on_new_point
+                    # on_new_batch only enqueues into the thread-safe plot
+                    # queue (drained by the plot timer), so it can run
+                    # directly in the acquisition thread
+                    self.device_manager.acquire_thread.multi_data_batch.connect(
+                        self.plot_widget.on_new_batch, Qt.DirectConnection
                     )
                 except Exception:  # pragma: no cover
                     pass
         else:
             # Fallback: start acquisition without plot connection
-            if not self.device_manager.acquire_thread:
-                self.device_manager.start_acquisition()
-            else:
-                try:
-                    if self.device_manager.acquire_thread.isRunning():
-                        self.device_manager.acquire_thread.multi_data_point.connect(
-                            self.handle_multi_data
-                        )
-                except Exception:  # pragma: no cover
-                    pass
+            self.device_manager.start_acquisition()
 
     def _setup_plot(self):
         """Initialise the plot widgets (frequency & gyro Z over elapsed time)."""
@@ -485,16 +476,24 @@ class MainWindow(QMainWindow):
     # 2. DATA PROCESSING AND STATISTICS
     #
 
-    def handle_multi_data(
-        self, elapsed_s: float, freq: float, accel_z: float, gyro_z: float
-    ):
-        """Handle incoming multi-channel data.
+    def handle_multi_batch(self, batch):
+        """Handle a batch of multi-channel samples.
+
+        Updates the stored data and series via DataController for all rows
+        of a multi_data_batch at once; the LCD displays show the last sample
+        of the batch.
 
-        Updates plots & table via DataController. Mark data unsaved if a
-        measurement session is active (saving toggled by start/stop buttons).
+        Args:
+            batch (np.ndarray): Rows of (elapsed_s, freq, accel_z, gyro_z)
         """
-        self.data_controller.handle_multi_data_point(elapsed_s, freq, accel_z, gyro_z)
+        if not len(batch):
+            return
+        self.data_controller.handle_multi_batch(batch)
+        _, freq, _, gyro_z = batch[-1].tolist()
+        self._update_live_displays(freq, gyro_z)
 
+    def _update_live_displays(self, freq: float, gyro_z: float):
+        """Update LCDs and save state after new data arrived."""
         # Update primary LCD display (frequency preferred, else gyro)
         display_value = (
             freq if not (freq is None or freq != freq) else gyro_z
@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 from typing import Iterable, Optional, List
-from collections import deque
 import queue
 import numpy as np
 import pyqtgraph as pg
@@ -44,8 +43,12 @@ class PlotWidget(pg.GraphicsLayoutWidget):
 
         self.fontsize = fontsize
         self.max_points = max_plot_points
-        # Setup data buffers with common x-axis
-        self.x_data = deque(maxlen=max_plot_points)
+        # Ring buffer of the displayed samples, one row of
+        # (elapsed_sec, freq, accel_z, gyro_z) per point; the x-axis is
+        # column 0 and each series reads its y_index column
+        self._ring = np.empty((max_plot_points, 4), dtype=np.float64)
+        self._ring_pos = 0  # next row to write
+        self._ring_count = 0  # valid rows
         self.series = {}
         self._user_interacted = False
 
@@ -129,7 +132,6 @@ class PlotWidget(pg.GraphicsLayoutWidget):
             )
             self.series[cfg["name"]] = {
                 "curve": curve,
-                "y": deque(maxlen=self.max_points),
                 "y_index": cfg["y_index"],
                 "plot": p,  # Store plot reference in series
             }
@@ -176,22 +178,40 @@ class PlotWidget(pg.GraphicsLayoutWidget):
             # Queue is full, skip this point (shouldn't happen with unlimited queue)
             return
 
+    @Slot(object)
+    def on_new_batch(self, batch):
+        """Add a batch of data points to the queue for later processing.
+
+        Only touches the thread-safe data_queue, so it may be connected with
+        Qt.DirectConnection and run in the emitting thread.
+
+        Args:
+            batch (np.ndarray): Array of shape (n, 4) with the columns
+                (elapsed_sec, freq, accel_z, gyro_z), as emitted with the
+                multi_data_batch signal
+        """
+        try:
+            self.data_queue.put_nowait(batch)
+        except queue.Full:
+            return
+
     def update_plots(self):
         """Process queued data points and update plots. Called by external timer."""
         if self.data_queue.empty():
             return
 
-        # Process all queued data points
-        points_processed = 0
-        while (
-            not self.data_queue.empty() and points_processed < 100
-        ):  # Limit to avoid blocking
+        # Process everything queued so far; batches are a few slice writes
+        # each, and a per-tick cap would let the queue grow without bound
+        # at high sample rates. Items queued meanwhile wait for the next tick
+        for _ in range(self.data_queue.qsize()):
             try:
-                elapsed_sec, freq, accel_z, gyro_z = self.data_queue.get_nowait()
-                self._add_data_point(elapsed_sec, freq, accel_z, gyro_z)
-                points_processed += 1
+                item = self.data_queue.get_nowait()
             except queue.Empty:
                 break
+            if isinstance(item, np.ndarray):
+                self._add_data_batch(item)
+            else:
+                self._add_data_point(*item)
 
         # Update visual curves only if in measurement mode
         if self.measurement_mode:
@@ -199,31 +219,58 @@ class PlotWidget(pg.GraphicsLayoutWidget):
 
     def _add_data_point(self, elapsed_sec, freq, accel_z, gyro_z):
         """Add a single data point to the internal buffers."""
-        vals = (elapsed_sec, freq, accel_z, gyro_z)
-        self.x_data.append(elapsed_sec)
-
-        # Update each series buffer
-        for s in self.series.values():
-            y = float(vals[s["y_index"]])
-            if not np.isfinite(y):
-                y = np.nan
-            s["y"].append(y)
+        row = self._ring[self._ring_pos]
+        row[:] = (elapsed_sec, freq, accel_z, gyro_z)
+        y = row[1:]
+        y[~np.isfinite(y)] = np.nan
+        self._ring_pos = (self._ring_pos + 1) % len(self._ring)
+        self._ring_count = min(self._ring_count + 1, len(self._ring))
+
+    def _add_data_batch(self, batch):
+        """Add a batch of data points (rows of _add_data_point values)."""
+        cap = len(self._ring)
+        batch = batch[-cap:]
+        n = len(batch)
+        pos = self._ring_pos
+        first = min(n, cap - pos)
+        written = (self._ring[pos : pos + first], self._ring[: n - first])
+        written[0][:] = batch[:first]
+        written[1][:] = batch[first:]
+        # Non-finite values are shown as gaps; sanitised in the ring so the
+        # sender's array stays unchanged
+        for rows in written:
+            y = rows[:, 1:]
+            y[~np.isfinite(y)] = np.nan
+        self._ring_pos = (pos + n) % cap
+        self._ring_count = min(self._ring_count + n, cap)
+
+    def _ordered_data(self):
+        """Return the buffered rows, oldest first.
+
+        Until the ring has wrapped this is a view into the ring buffer, so
+        callers must copy whatever they keep.
+        """
+        if self._ring_count < len(self._ring):
+            return self._ring[: self._ring_count]
+        pos = self._ring_pos
+        return np.concatenate((self._ring[pos:], self._ring[:pos]))
 
     def _refresh_curves(self):
         """Update all plot curves with current data."""
-        if not self.x_data:
+        if not self._ring_count:
             return
 
-        x_arr = np.array(self.x_data, dtype=float)
+        data = self._ordered_data()
+        # pyqtgraph keeps the arrays passed to setData; hand it copies so
+        # later ring writes can't change a frozen curve (export, re-render)
+        x_arr = data[:, 0].copy()
         for s in self.series.values():
-            if s["y"]:
-                y_arr = np.array(s["y"], dtype=float)
-                s["curve"].setData(x_arr, y_arr)
+            s["curve"].setData(x_arr, data[:, s["y_index"]].copy())
 
-                # Auto-scroll to latest data if enabled
-                if self.auto_scroll_enabled and len(x_arr) > 0:
-                    plot = s["plot"]
-                    plot.setXRange(x_arr[0], x_arr[-1], padding=0.02)
+            # Auto-scroll to latest data if enabled
+            if self.auto_scroll_enabled and len(x_arr) > 0:
+                plot = s["plot"]
+                plot.setXRange(x_arr[0], x_arr[-1], padding=0.02)
 
     def add_measurement_marker(self, _x_position: float, _is_start: bool = True):
         """Add a vertical line marker to indicate measurement start/stop.
@@ -247,7 +294,7 @@ class PlotWidget(pg.GraphicsLayoutWidget):
     def set_max_points(self, new_max: int):
         """Set the maximum number of points kept and displayed.
 
-        Rebuilds the internal deques to apply the new capacity while
+        Rebuilds the internal ring buffer to apply the new capacity while
         preserving the most recent data up to the new limit.
 
         Args:
@@ -262,18 +309,12 @@ class PlotWidget(pg.GraphicsLayoutWidget):
         if new_max == self.max_points:
             return
 
-        # Rebuild x_data deque
-        x_buf = list(self.x_data)
-        if len(x_buf) > new_max:
-            x_buf = x_buf[-new_max:]
-        self.x_data = deque(x_buf, maxlen=new_max)
-
-        # Rebuild each series' y buffer
-        for s in self.series.values():
-            y_buf = list(s["y"])
-            if len(y_buf) > new_max:
-                y_buf = y_buf[-new_max:]
-            s["y"] = deque(y_buf, maxlen=new_max)
+        # Rebuild the ring buffer, keeping the most recent rows
+        data = self._ordered_data()[-new_max:]
+        self._ring = np.empty((new_max, 4), dtype=np.float64)
+        self._ring[: len(data)] = data
+        self._ring_count = len(data)
+        self._ring_pos = len(data) % new_max
 
         self.max_points = new_max
 
@@ -297,9 +338,9 @@ class PlotWidget(pg.GraphicsLayoutWidget):
 
     def clear_plot_data(self):
         """Clear all plot data buffers."""
-        self.x_data.clear()
+        self._ring_pos = 0
+        self._ring_count = 0
         for series in self.series.values():
-            series["y"].clear()
             # Clear the visual curves immediately
             series["curve"].setData([], [])
 